@@ -13,25 +13,41 @@ Then previews an "Android-style" notification in:
 Dependencies:
     pip install pillow requests
 
+    Optional, faster image resizing (drop-in Pillow replacement built with AVX2):
+    pip uninstall -y pillow
+    CC="cc -mavx2" pip install --no-binary :all: --force-reinstall pillow-simd
+
+    Optional, SIMD Lanczos resize via Rust's fast_image_resize (used when present):
+    pip install "cykooz.resizer[pillow]"  (4.x imports as cykooz_resizer)
+
 Run:
     python notif_previewer.py
 """
 
 import io
 import textwrap
+from concurrent.futures import ThreadPoolExecutor
 import tkinter as tk
 from tkinter import ttk, messagebox
-import os
 from urllib.parse import urlparse
 
 
 try:
     import requests
+    import PIL
     from PIL import Image, ImageTk
     try:
         import cairosvg
     except Exception:
         cairosvg = None
+    try:
+        # 4.x ships as cykooz_resizer; 3.x as the cykooz.resizer namespace package
+        from cykooz_resizer import CropBox, FilterType, ResizeAlg, ResizeOptions, Resizer
+    except ImportError:
+        try:
+            from cykooz.resizer import CropBox, FilterType, ResizeAlg, ResizeOptions, Resizer
+        except ImportError:
+            Resizer = None
 except Exception as e:
     raise SystemExit(
         "Missing dependencies. Install with:\n"
@@ -39,6 +55,29 @@ except Exception as e:
         f"Original error: {e}"
     )
 
+# Pillow-SIMD tags its releases as "X.Y.Z.postN"; same API, SIMD resample kernels.
+PILLOW_SIMD = "post" in getattr(PIL, "__version__", "")
+
+# Bound once so render paths skip the attribute lookups
+LANCZOS = Image.LANCZOS
+BILINEAR = Image.BILINEAR
+BOX = Image.BOX
+PhotoImage = ImageTk.PhotoImage
+
+IMG_CACHE_BYTES = 64 * 1024 * 1024  # decoded pixels kept per session, keyed by URL
+PREVIEW_W, PREVIEW_H = 360, 180  # default big picture size
+PREVIEW_BG = "#2a2a2a"  # big picture canvas color, also behind transparent images
+GENERATE_DELAY_MS = 150  # debounce window for schedule_generate
+MAX_BYTES = 8 * 1024 * 1024  # refuse remote images larger than this
+
+# Source modes cykooz.resizer's resize_pil accepts (no "LA"); others go through Pillow
+_FAST_RESIZER = Resizer() if Resizer is not None else None
+_FAST_RESIZE_MODES = ("L", "RGB", "RGBA", "CMYK")
+# Modes fit_cover resamples as-is; anything else is converted first
+_RESAMPLE_MODES = ("RGB", "RGBA", "L", "LA", "CMYK")
+
+# logo.png decoded and resized once, shared by every NotificationPreview
+_LOGO_CACHE = {"raw": None}
 
 
 # ----------------------------
@@ -61,59 +100,166 @@ def _looks_like_svg(url: str, content_type: str | None) -> bool:
     return False
 
 
-def fetch_image(url: str, timeout=10) -> Image.Image | None:
-    """Fetch image from URL (PNG/JPG/WebP, plus SVG if cairosvg installed)."""
+def fetch_image(url: str, session=None, timeout=10,
+                target_width: int | None = None,
+                target_height: int | None = None) -> Image.Image | None:
+    """Fetch image from URL (PNG/JPG/WebP, plus SVG if cairosvg installed).
+
+    Pass a requests.Session to reuse connections across calls. target_width/
+    target_height is the preview size the image is headed for; SVGs are
+    rasterized and JPEGs decoded at ~2x that (for HiDPI) rather than full size.
+    """
+    # An unmapped canvas reports 1x1, so never go below the default preview size
+    target_width = max(target_width or 0, PREVIEW_W)
+    target_height = max(target_height or 0, PREVIEW_H)
     url = (url or "").strip()
     if not url:
         return None
     try:
         headers = {"User-Agent": "NotifPreviewer/1.0 (requests)"}
-        resp = requests.get(url, headers=headers, timeout=timeout)
-        resp.raise_for_status()
-
-        ctype = resp.headers.get("Content-Type", "")
-        data = resp.content
-
-        # Handle SVG via cairosvg -> PNG bytes -> Pillow
-        if _looks_like_svg(url, ctype):
-            if cairosvg is None:
-                # SVG support not installed
+        with (session or requests).get(url, headers=headers, timeout=timeout,
+                                       stream=True) as resp:
+            resp.raise_for_status()
+            if int(resp.headers.get("Content-Length") or 0) > MAX_BYTES:
                 return None
-            try:
-                png_bytes = cairosvg.svg2png(bytestring=data, output_width=1200)
-                img = Image.open(io.BytesIO(png_bytes)).convert("RGB")
-                return img
-            except Exception:
+            # Let urllib3 undo gzip/deflate so raw yields the actual image bytes
+            resp.raw.decode_content = True
+            # Content-Length may be absent (chunked), so cap the read itself
+            data = resp.raw.read(MAX_BYTES + 1)
+            if len(data) > MAX_BYTES:
                 return None
 
-        # Normal raster images
-        img = Image.open(io.BytesIO(data)).convert("RGB")
-        return img
+            ctype = resp.headers.get("Content-Type", "")
+
+            # Handle SVG via cairosvg -> PNG bytes -> Pillow
+            if _looks_like_svg(url, ctype):
+                if cairosvg is None:
+                    # SVG support not installed
+                    return None
+                try:
+                    out_w = target_width * 2
+                    png_bytes = cairosvg.svg2png(bytestring=data, output_width=out_w)
+                    img = Image.open(io.BytesIO(png_bytes))
+                    img.load()  # decode on the worker thread, like raster images
+                    return img
+                except Exception:
+                    return None
+
+            # Normal raster images
+            img = Image.open(io.BytesIO(data))
+            if img.format == "JPEG":
+                # libjpeg scales by 1/2..1/8 during IDCT, keeping >= requested size
+                img.draft("RGB", (target_width * 2, target_height * 2))
+            # Decode here on the worker thread, in the native mode; fit_cover
+            # converts the small result to RGB.
+            img.load()
+            return img
 
     except Exception:
         return None
 
 
 
-def fit_cover(img: Image.Image, target_w: int, target_h: int) -> Image.Image:
-    """Resize/crop image to cover the target box (like centerCrop)."""
+def _image_nbytes(img: Image.Image) -> int:
+    """Approximate decoded size (one byte per band per pixel)."""
+    w, h = img.size
+    return w * h * len(img.getbands())
+
+
+def _cover_box(iw: int, ih: int, target_w: int, target_h: int) -> tuple[float, float, float, float]:
+    """Centered source region that scales onto the target box (like centerCrop).
+
+    This is the largest target-aspect crop of the source, so resize(box=...)
+    never resamples pixels that get thrown away, upscaling or downscaling.
+    """
+    cw = min(iw, ih * target_w / target_h)
+    ch = min(ih, iw * target_h / target_w)
+    sx, sy = (iw - cw) / 2, (ih - ch) / 2
+    return (sx, sy, sx + cw, sy + ch)
+
+
+def _fast_resize(img: Image.Image, size: tuple[int, int],
+                 box: tuple[float, float, float, float]) -> Image.Image | None:
+    """Lanczos3 crop+resize with cykooz.resizer; None if not installed or unsupported mode."""
+    if _FAST_RESIZER is None or img.mode not in _FAST_RESIZE_MODES:
+        return None
+    dst = Image.new(img.mode, size)
+    left, top, right, bottom = box
+    options = ResizeOptions(
+        resize_alg=ResizeAlg.convolution(FilterType.lanczos3),
+        crop_box=CropBox(left, top, right - left, bottom - top),
+    )
+    _FAST_RESIZER.resize_pil(img, dst, options)
+    return dst
+
+
+def fit_cover(img: Image.Image, target_w: int, target_h: int,
+              high_quality: bool = False) -> Image.Image:
+    """Resize/crop image to cover the target box (like centerCrop).
+
+    Uses cykooz.resizer's SIMD Lanczos3 when installed. Otherwise previews are
+    small, so Pillow's BILINEAR is used by default; pass high_quality=True to
+    get the slower LANCZOS filter. Accepts any source mode; the result is
+    always RGB.
+    """
     if img is None:
         return None
     iw, ih = img.size
     if iw <= 0 or ih <= 0:
         return None
+    if img.mode not in _RESAMPLE_MODES:
+        # Palette/bilevel only get NEAREST and 16-bit/float modes can't be
+        # box-reduced, so bring those to 8-bit first, keeping any transparency
+        has_alpha = img.mode.endswith(("A", "a")) or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "RGB")
 
-    scale = max(target_w / iw, target_h / ih)
-    nw, nh = int(iw * scale), int(ih * scale)
-    resized = img.resize((nw, nh), Image.LANCZOS)
+    result = _fast_resize(img, (target_w, target_h), _cover_box(iw, ih, target_w, target_h))
+    if result is not None:
+        return _flatten_rgb(result)
 
-    left = max(0, (nw - target_w) // 2)
-    top = max(0, (nh - target_h) // 2)
-    return resized.crop((left, top, left + target_w, top + target_h))
+    scale = max(target_w / iw, target_h / ih)
+    if high_quality:
+        resample = LANCZOS
+        if scale < 0.25:
+            # Huge source: reducing_gap integer-reduces to ~3x before LANCZOS
+            img = img.copy()
+            img.thumbnail((int(iw * 2 * scale), int(ih * 2 * scale)), LANCZOS,
+                          reducing_gap=3.0)
+            iw, ih = img.size
+    else:
+        resample = BILINEAR
+        if scale <= 0.5:
+            # Big downscale: cheap box-reduce to ~2x target first
+            img = img.copy()
+            img.thumbnail((int(iw * 2 * scale), int(ih * 2 * scale)), BOX)
+            iw, ih = img.size
+
+    # resize(box=...) crops and resamples in one pass without an oversized intermediate
+    box = _cover_box(iw, ih, target_w, target_h)
+    result = img.resize((target_w, target_h), resample, box=box)
+    return _flatten_rgb(result)
+
+
+def _flatten_rgb(img: Image.Image) -> Image.Image:
+    """RGB copy of img, with any alpha composited over the big picture background."""
+    if img.mode == "RGB":
+        return img
+    if img.mode not in ("RGBA", "LA"):
+        return img.convert("RGB")
+    # convert("RGB") would just drop alpha, exposing whatever color the
+    # (premultiplied) resize left under transparent pixels
+    bg = Image.new("RGB", img.size, PREVIEW_BG)
+    bg.paste(img.convert("RGB"), mask=img.getchannel("A"))
+    return bg
 
 
 def ellipsize(text: str, max_chars: int) -> str:
-    t = (text or "").replace("\n", " ").strip()
+    if not text:
+        return ""
+    # Common case (short single-line title): skip the replace() copy
+    if len(text) <= max_chars and "\n" not in text:
+        return text.strip()
+    t = text.replace("\n", " ").strip()
     if len(t) <= max_chars:
         return t
     if max_chars <= 1:
@@ -135,8 +281,11 @@ class NotificationPreview(ttk.Frame):
     def __init__(self, master, mode: str, **kwargs):
         super().__init__(master, **kwargs)
         self.mode = mode  # "collapsed" or "expanded"
-        self._photo_big = None  # keep references
+        self._photo_big = None  # keep references; pasted into while the size matches
         self._photo_icon = None
+        self._photo_src = None  # image last drawn into _photo_big, and at what size
+        self._photo_size = None
+        self._last_args = None  # (title, body, size, img) of the last render
 
         # Styling-ish
         self.configure(padding=12)
@@ -174,7 +323,7 @@ class NotificationPreview(ttk.Frame):
             self.big_frame.pack(fill="x", padx=12, pady=(0, 12))
 
         self.big_canvas = tk.Canvas(self.big_frame, width=360, height=180,
-                                    bg="#2a2a2a", highlightthickness=1, highlightbackground="#303030")
+                                    bg=PREVIEW_BG, highlightthickness=1, highlightbackground="#303030")
         if self.mode == "expanded":
             self.big_canvas.pack(fill="x")
 
@@ -191,17 +340,19 @@ class NotificationPreview(ttk.Frame):
         self.icon_canvas.delete("all")
 
         logo_path = "logo.png"  # must be next to your .py, or change path
-        if os.path.exists(logo_path):
-            try:
-                img = Image.open(logo_path).convert("RGBA")
-                img = img.resize((30, 30), Image.LANCZOS)
-                self._photo_icon = ImageTk.PhotoImage(img)
-                # draw a subtle rounded backing
-                self.icon_canvas.create_oval(3, 3, 33, 33, fill="#2b2b2b", outline="")
-                self.icon_canvas.create_image(18, 18, image=self._photo_icon, anchor="center")
-                return
-            except Exception:
-                pass
+        try:
+            if _LOGO_CACHE["raw"] is None:
+                with Image.open(logo_path) as img:
+                    _LOGO_CACHE["raw"] = img.convert("RGBA").resize((30, 30), LANCZOS)
+            # PhotoImage is tied to a Tk interpreter, so only it is per-instance
+            self._photo_icon = PhotoImage(_LOGO_CACHE["raw"])
+            # draw a subtle rounded backing
+            self.icon_canvas.create_oval(3, 3, 33, 33, fill="#2b2b2b", outline="")
+            self.icon_canvas.create_image(18, 18, image=self._photo_icon, anchor="center")
+            return
+        except (OSError, tk.TclError):
+            # OSError covers FileNotFoundError and PIL's UnidentifiedImageError
+            pass
 
         # fallback if logo.png missing/broken
         self.icon_canvas.create_oval(3, 3, 33, 33, fill="#4a90e2", outline="")
@@ -214,6 +365,15 @@ class NotificationPreview(ttk.Frame):
         title = (title or "").strip()
         body = (body or "").strip()
 
+        size = None
+        if self.mode == "expanded":
+            size = (int(self.big_canvas.winfo_width() or PREVIEW_W),
+                    int(self.big_canvas.winfo_height() or PREVIEW_H))
+        last = self._last_args
+        if last is not None and (title, body, size) == last[:3] and img is last[3]:
+            return  # nothing to redraw
+        self._last_args = (title, body, size, img)
+
         if self.mode == "collapsed":
             display_title = ellipsize(title if title else "Title", 38)
             # approximate 2 lines ~ 90 chars
@@ -224,24 +384,36 @@ class NotificationPreview(ttk.Frame):
             display_body = ellipsize(body if body else "Body", 220)
 
         self.title_label.config(text=display_title)
-        # wrap to fit width a bit; Tk wraps by pixels if wraplength set
-        self.body_label.config(text=display_body, wraplength=420)
+        # wrap to fit width a bit; Tk wraps by pixels if wraplength set.
+        # Collapsed: break the 92 chars into 2 lines ourselves, skipping Tk's measuring.
+        if self.mode == "collapsed":
+            self.body_label.config(text=textwrap.fill(display_body, 46, max_lines=2, placeholder="…"),
+                                   wraplength=0)
+        else:
+            self.body_label.config(text=display_body, wraplength=420)
 
         # Expanded big image
         if self.mode == "expanded":
             self.big_canvas.delete("all")
-            w = int(self.big_canvas.winfo_width() or 360)
-            h = int(self.big_canvas.winfo_height() or 180)
+            w, h = size
 
             if img is None:
                 # placeholder
-                self.big_canvas.create_rectangle(0, 0, w, h, fill="#2a2a2a", outline="#303030")
+                self.big_canvas.create_rectangle(0, 0, w, h, fill=PREVIEW_BG, outline="#303030")
                 self.big_canvas.create_text(w // 2, h // 2, text="(No image / couldn't load)",
                                             fill="#bdbdbd", font=("Segoe UI", 10))
-                self._photo_big = None
+                # keep _photo_big itself around to paste the next image into
+                self._photo_src = None
             else:
-                fitted = fit_cover(img, w, h)
-                self._photo_big = ImageTk.PhotoImage(fitted)
+                if not (self._photo_src is img and self._photo_size == (w, h)):
+                    # App passes images already fitted to this canvas
+                    fitted = img if img.size == (w, h) else fit_cover(img, w, h)
+                    photo = self._photo_big
+                    if photo is not None and (photo.width(), photo.height()) == (w, h):
+                        photo.paste(fitted)  # reuse the Tk image handle
+                    else:
+                        self._photo_big = PhotoImage(fitted)
+                    self._photo_src, self._photo_size = img, (w, h)
                 self.big_canvas.create_image(0, 0, image=self._photo_big, anchor="nw")
 
 
@@ -256,11 +428,22 @@ class NotificationPreview(ttk.Frame):
 class App(tk.Tk):
     def __init__(self):
         super().__init__()
-        self.title("Android Notification Previewer")
+        self.title("Android Notification Previewer" + (" (Pillow-SIMD)" if PILLOW_SIMD else ""))
         self.geometry("980x620")
         self.minsize(920, 560)
 
         self._last_img = None
+        self._last_state = None  # (title, body, canvas size) rendered alongside _last_img
+        self._fitted = None  # (source img, size, fitted img) shared by both previews
+        self._img_cache = {}  # url -> decoded image, least recently used first
+        self._img_cache_bytes = 0  # _image_nbytes total of _img_cache
+
+        # Fetches run off the UI thread; the session reuses TCP/TLS connections
+        self._session = requests.Session()
+        self._pool = ThreadPoolExecutor(max_workers=2)
+        self._fetch_seq = 0  # bumps on each fetch/clear so stale results aren't rendered
+        self._inflight = {}  # url -> Future of a fetch still running
+        self._pending = None  # after() id of a scheduled generate, if any
 
         # Layout
         self.columnconfigure(0, weight=1)
@@ -297,7 +480,7 @@ class App(tk.Tk):
         btn_row.columnconfigure(0, weight=1)
         btn_row.columnconfigure(1, weight=1)
 
-        self.gen_btn = ttk.Button(btn_row, text="Generate Preview", command=self.generate)
+        self.gen_btn = ttk.Button(btn_row, text="Generate Preview", command=self.schedule_generate)
         self.gen_btn.grid(row=0, column=0, sticky="ew", padx=(0, 6))
 
         self.clear_btn = ttk.Button(btn_row, text="Clear", command=self.clear)
@@ -326,35 +509,129 @@ class App(tk.Tk):
         self.body_text.insert("1.0", "Insert text")
         self.img_var.set("")
 
-        self.after(50, self.generate)  # initial render after layout
+        self.schedule_generate()  # initial render after layout
+
+    def destroy(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self._session.close()
+        super().destroy()
 
     def clear(self):
         self.title_var.set("")
         self.body_text.delete("1.0", "end")
         self.img_var.set("")
+        self._cancel_pending()
+        self._fetch_seq += 1
         self._last_img = None
+        self._last_state = None
         self.collapsed.set_content("", "", None)
         self.expanded.set_content("", "", None)
 
+    def _cache_image(self, url: str, img: Image.Image):
+        # Failed fetches aren't cached so a retry can still succeed. Stored
+        # as-is: fit_cover never mutates its input.
+        old = self._img_cache.pop(url, None)
+        if old is not None:
+            self._img_cache_bytes -= _image_nbytes(old)
+        self._img_cache[url] = img
+        self._img_cache_bytes += _image_nbytes(img)
+        # Evict least recently used until under the cap, always keeping the image just added
+        while len(self._img_cache) > 1 and self._img_cache_bytes > IMG_CACHE_BYTES:
+            evicted = self._img_cache.pop(next(iter(self._img_cache)))
+            self._img_cache_bytes -= _image_nbytes(evicted)
+        return img
+
+    def schedule_generate(self, delay_ms=GENERATE_DELAY_MS):
+        """Coalesce bursts of requests (e.g. key presses) into one generate()."""
+        self._cancel_pending()
+        self._pending = self.after(delay_ms, self._do_generate)
+
+    def _cancel_pending(self):
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+
+    def _do_generate(self):
+        self._pending = None
+        self.generate()
+
     def generate(self):
         title = self.title_var.get()
         body = self.body_text.get("1.0", "end").strip()
         url = self.img_var.get().strip()
 
-        img = None
-        if url:
-            # Fetch on UI thread for simplicity; for huge images/slow net, you could thread it.
-            img = fetch_image(url)
-            if img is None:
-                messagebox.showwarning(
-                    "Image load failed",
-                    "Couldn't load the image from that URL.\n"
-                    "Preview will show a placeholder."
-                )
-
+        self._fetch_seq += 1
+        seq = self._fetch_seq
+        img = self._img_cache.get(url) if url else None
+        if img is not None:
+            self._img_cache[url] = self._img_cache.pop(url)  # mark most recently used
+        if url and img is None:
+            future = self._inflight.get(url)
+            if future is None:
+                canvas = self.expanded.big_canvas
+                future = self._pool.submit(fetch_image, url, self._session,
+                                           target_width=canvas.winfo_width(),
+                                           target_height=canvas.winfo_height())
+                self._inflight[url] = future
+            # Already-running fetches just get another listener
+            future.add_done_callback(
+                lambda f: self._post_fetch(seq, title, body, url, f)
+            )
+            return
+
+        self._render(title, body, img)
+
+    def _post_fetch(self, seq, title, body, url, future):
+        # Runs on the worker thread: hand the result back to the Tk loop.
+        if future.cancelled():
+            return  # dropped by destroy()'s shutdown(cancel_futures=True)
+        try:
+            self.after(0, self._apply_img, seq, title, body, url, future)
+        except (RuntimeError, tk.TclError):
+            pass  # window already closed
+
+    def _apply_img(self, seq, title, body, url, future):
+        img = future.result()
+        if self._inflight.get(url) is future:
+            del self._inflight[url]
+        # Cache even when superseded, so the next generate() for this URL hits
+        if img is not None and self._img_cache.get(url) is not img:
+            self._cache_image(url, img)
+        if seq != self._fetch_seq:
+            return  # superseded by a newer generate/clear
+        if img is None:
+            messagebox.showwarning(
+                "Image load failed",
+                "Couldn't load the image from that URL.\n"
+                "Preview will show a placeholder."
+            )
+        self._render(title, body, img)
+
+    def _render(self, title, body, img):
+        # The big picture canvas is packed fill="x", so window resizes change its size
+        size = self._preview_size()
+        if (title, body, size) == self._last_state and img is self._last_img:
+            return  # same inputs as the previous render
+        self._last_state = (title, body, size)
         self._last_img = img
-        self.collapsed.set_content(title, body, img)
-        self.expanded.set_content(title, body, img)
+        fitted = self._fit_for_previews(img, size)
+        self.collapsed.set_content(title, body, fitted)
+        self.expanded.set_content(title, body, fitted)
+
+    def _preview_size(self):
+        canvas = self.expanded.big_canvas
+        return (int(canvas.winfo_width() or PREVIEW_W), int(canvas.winfo_height() or PREVIEW_H))
+
+    def _fit_for_previews(self, img, size):
+        """fit_cover once for both previews, reused while img and size are unchanged."""
+        if img is None:
+            self._fitted = None
+            return None
+        if self._fitted is not None and self._fitted[0] is img and self._fitted[1] == size:
+            return self._fitted[2]
+        fitted = fit_cover(img, *size)
+        self._fitted = (img, size, fitted)
+        return fitted
 
 
 if __name__ == "__main__":